@@ -1,18 +1,36 @@
 import json
 import os
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 import sys
 from pathlib import Path
+from itertools import islice
+from types import MappingProxyType
 import asyncio
-from typing import Dict
+import random
+from typing import Dict, Optional
 
 import aiohttp
 import discord
 from discord.ext import tasks, commands
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+try:
+    import aiodns
+except ImportError:  # aiodns is optional; aiohttp falls back to its threaded resolver
+    aiodns = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,11 +43,18 @@ if not env_path.exists():
     raise FileNotFoundError("No .env file found. Please create one from .env.example")
 load_dotenv(env_path)
 
+# Embed timestamps are timezone-aware UTC; Discord shows them in each viewer's local time
+_UTC = timezone.utc
+
 # Configuration file path
 CONFIG_FILE = Path('.') / 'config.json'
 
+# Bumped whenever the on-disk config layout changes and needs migrating
+CONFIG_SCHEMA_VERSION = 2
+
 # Default configuration
 DEFAULT_CONFIG = {
+    'schema_version': CONFIG_SCHEMA_VERSION,
     'channels': {},  # channel_id -> {'message_id': int, 'refresh_interval_minutes': int}
     'default_refresh_interval_minutes': 5,  # Default interval for new channels
 }
@@ -38,149 +63,270 @@ def load_config():
     """Load configuration from file or create with defaults if not exists."""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                loaded_config = json.load(f)
-                
-                # Convert string keys to integers for channel IDs
-                if 'channels' in loaded_config:
-                    # Handle both old and new format
-                    new_channels = {}
-                    for channel_id, value in loaded_config['channels'].items():
-                        channel_id = int(channel_id)
-                        if isinstance(value, dict):
-                            # New format: already has message_id and refresh_interval
-                            new_channels[channel_id] = {
-                                'message_id': int(value['message_id']),
-                                'refresh_interval_minutes': int(value['refresh_interval_minutes'])
-                            }
-                        else:
-                            # Old format: just message_id
-                            new_channels[channel_id] = {
-                                'message_id': int(value),
+            with open(CONFIG_FILE, 'rb') as f:
+                raw_config = f.read()
+            loaded_config = orjson.loads(raw_config) if orjson is not None else json.loads(raw_config)
+            
+            # Already-migrated configs only need their channel IDs turned back into ints
+            if loaded_config.get('schema_version') == CONFIG_SCHEMA_VERSION:
+                loaded_config['channels'] = {
+                    int(channel_id): channel_config
+                    for channel_id, channel_config in loaded_config['channels'].items()
+                }
+                logging.info(f"Loaded config with {len(loaded_config['channels'])} channels")
+                return loaded_config
+            
+            # Convert string keys to integers for channel IDs
+            if 'channels' in loaded_config:
+                # Handle both old and new format
+                new_channels = {}
+                for channel_id, value in loaded_config['channels'].items():
+                    channel_id = int(channel_id)
+                    if isinstance(value, dict):
+                        # New format: already has message_id and refresh_interval
+                        new_channels[channel_id] = {
+                            'message_id': int(value['message_id']),
+                            'refresh_interval_minutes': int(value['refresh_interval_minutes'])
+                        }
+                    else:
+                        # Old format: just message_id
+                        new_channels[channel_id] = {
+                            'message_id': int(value),
+                            'refresh_interval_minutes': loaded_config.get('refresh_interval_minutes', DEFAULT_CONFIG['default_refresh_interval_minutes'])
+                        }
+                loaded_config['channels'] = new_channels
+            else:
+                # Migrate very old config format if needed
+                if loaded_config.get('channel_id'):
+                    channel_id = int(loaded_config['channel_id'])
+                    message_id = int(loaded_config['message_id']) if loaded_config.get('message_id') else None
+                    loaded_config = {
+                        'channels': {
+                            channel_id: {
+                                'message_id': message_id,
                                 'refresh_interval_minutes': loaded_config.get('refresh_interval_minutes', DEFAULT_CONFIG['default_refresh_interval_minutes'])
                             }
-                    loaded_config['channels'] = new_channels
-                else:
-                    # Migrate very old config format if needed
-                    if loaded_config.get('channel_id'):
-                        channel_id = int(loaded_config['channel_id'])
-                        message_id = int(loaded_config['message_id']) if loaded_config.get('message_id') else None
-                        loaded_config = {
-                            'channels': {
-                                channel_id: {
-                                    'message_id': message_id,
-                                    'refresh_interval_minutes': loaded_config.get('refresh_interval_minutes', DEFAULT_CONFIG['default_refresh_interval_minutes'])
-                                }
-                            }
                         }
-                
-                # Ensure default refresh interval exists
-                if 'default_refresh_interval_minutes' not in loaded_config:
-                    loaded_config['default_refresh_interval_minutes'] = DEFAULT_CONFIG['default_refresh_interval_minutes']
-                
-                logging.info(f"Loaded config with {len(loaded_config.get('channels', {}))} channels")
-                return loaded_config
+                    }
+            
+            # Ensure default refresh interval exists
+            if 'default_refresh_interval_minutes' not in loaded_config:
+                loaded_config['default_refresh_interval_minutes'] = DEFAULT_CONFIG['default_refresh_interval_minutes']
+            loaded_config.setdefault('channels', {})
+            
+            # Record the migration so later startups take the fast path above
+            loaded_config['schema_version'] = CONFIG_SCHEMA_VERSION
+            save_config(loaded_config)
+            
+            logging.info(f"Loaded config with {len(loaded_config.get('channels', {}))} channels")
+            return loaded_config
         except (json.JSONDecodeError, ValueError) as e:
             logging.error(f"Error loading config: {e}")
             return DEFAULT_CONFIG.copy()
     else:
         logging.info("No config file found, creating with defaults")
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=4)
+        save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG.copy()
 
+def serialize_config(config) -> bytes:
+    """Serialize configuration to the bytes stored in the config file."""
+    if orjson is not None:
+        # Channel IDs are int keys, which orjson only accepts with OPT_NON_STR_KEYS
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, indent=4).encode()
+
+def write_config_file(payload: bytes):
+    """Replace the config file with payload.
+
+    Writes to a temporary file first and swaps it into place, so a crash
+    mid-write never leaves a truncated config behind.
+    """
+    tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, CONFIG_FILE)
+
 def save_config(config):
     """Save configuration to file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        write_config_file(serialize_config(config))
         logging.info(f"Saved config with {len(config.get('channels', {}))} channels")
     except Exception as e:
         logging.error(f"Error saving config: {e}")
 
 class ChannelTracker:
     """Manages tracking of channel update times and configuration."""
+    # Channels due within this many seconds count as due now, so small timing
+    # drift doesn't push them back a whole tick of the one-minute update loop
+    DUE_SLACK_SECONDS = 30
+    # Config changes are written this long after the latest one, so a burst shares one write
+    SAVE_DEBOUNCE_SECONDS = 0.25
+
     def __init__(self):
         self.config_lock = asyncio.Lock()
+        # Serializes file writes so they land in the order the config was serialized
+        self._write_lock = asyncio.Lock()
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_requested = False
         self._config = load_config()
-        # Initialize last updates from config or with empty dict
+        # Initialize last updates from config or with empty dict. Update times are
+        # tracked on the monotonic clock but persisted as wall-clock timestamps.
+        wall_offset = time.time() - time.monotonic()
         self._last_updates: Dict[int, float] = {
-            int(channel_id): self._config['channels'][channel_id].get('last_update_time', 0)
-            for channel_id in self._config['channels']
+            channel_id: channel_config['last_update_time'] - wall_offset
+            for channel_id, channel_config in self._config['channels'].items()
+            if channel_config.get('last_update_time')
         }
         self._last_openai_status = None
         self._last_anthropic_status = None
+        # Set when in-memory config has changes not yet written by flush()
+        self._dirty = False
+        # Per-channel refresh interval (minutes) and next monotonic due time, kept in sync with config
+        self._interval_cache: Dict[int, int] = {}
+        self._next_due: Dict[int, float] = {}
+        self._rebuild_schedule()
+
+    def _rebuild_schedule(self):
+        """Recompute cached refresh intervals and due times from the config."""
+        default_interval = self._config['default_refresh_interval_minutes']
+        self._interval_cache = {
+            channel_id: channel_config.get('refresh_interval_minutes', default_interval)
+            for channel_id, channel_config in self._config['channels'].items()
+        }
+        # Channels that were never updated have no entry and are due immediately
+        self._next_due = {
+            channel_id: self._last_updates[channel_id] + interval * 60
+            for channel_id, interval in self._interval_cache.items()
+            if channel_id in self._last_updates
+        }
 
     async def get_config(self):
-        """Thread-safe access to configuration."""
-        async with self.config_lock:
-            return self._config.copy()
+        """Snapshot of the configuration that callers are free to modify.
+
+        Reads don't take the lock: writers only ever swap in new config and
+        channel dicts, so the snapshot is consistent without it.
+        """
+        config = self._config
+        return {
+            **config,
+            'channels': {
+                channel_id: dict(channel_config)
+                for channel_id, channel_config in config['channels'].items()
+            }
+        }
 
     async def update_config(self, new_config):
-        """Thread-safe configuration update."""
+        """Thread-safe configuration update.
+
+        Returns:
+            A read-only view of the new config, so callers can keep reading it
+            without another get_config() round trip
+        """
         async with self.config_lock:
             # Preserve last update times when updating config
-            for channel_id in new_config['channels']:
-                if channel_id in self._last_updates:
-                    new_config['channels'][channel_id]['last_update_time'] = self._last_updates[channel_id]
+            current_channels = self._config['channels']
+            for channel_id, channel_config in new_config['channels'].items():
+                if 'last_update_time' in current_channels.get(channel_id, {}):
+                    channel_config['last_update_time'] = current_channels[channel_id]['last_update_time']
             self._config = new_config
-            save_config(new_config)
+            self._rebuild_schedule()
+            self._dirty = True
+        self._schedule_save()
+        return self.config
+
+    def _schedule_save(self):
+        """Write the config shortly, folding in any further changes made meanwhile."""
+        self._save_requested = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        """Flush the config once the debounce window has passed.
+
+        Saves requested while a write is in progress are picked up by another
+        round, so they don't wait for the periodic flush.
+        """
+        while self._save_requested:
+            await asyncio.sleep(self.SAVE_DEBOUNCE_SECONDS)
+            self._save_requested = False
+            await self.flush()
 
     async def should_update_channel(self, channel_id: int) -> bool:
-        """Thread-safe check if a channel is due for an update."""
-        async with self.config_lock:
-            current_time = time.time()
-            last_update = self._last_updates.get(channel_id, 0)
-            elapsed_minutes = (current_time - last_update) / 60
-            
-            # Get channel-specific refresh interval
-            channel_config = self._config['channels'].get(channel_id, {})
-            refresh_interval = channel_config.get('refresh_interval_minutes', 
-                                                self._config['default_refresh_interval_minutes'])
-            
-            return elapsed_minutes >= refresh_interval
+        """Lock-free check if a channel is due for an update."""
+        return time.monotonic() + self.DUE_SLACK_SECONDS >= self._next_due.get(channel_id, 0.0)
 
     async def mark_channel_updated(self, channel_id: int):
         """Thread-safe marking of channel update time."""
         async with self.config_lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             self._last_updates[channel_id] = current_time
-            # Update the last update time in config
-            if channel_id in self._config['channels']:
-                self._config['channels'][channel_id]['last_update_time'] = current_time
-                save_config(self._config)
+            if channel_id in self._interval_cache:
+                self._next_due[channel_id] = current_time + self._interval_cache[channel_id] * 60
+            # Update the wall-clock update time in config (persisted by the next flush)
+            channels = self._config['channels']
+            if channel_id in channels:
+                channels[channel_id] = {**channels[channel_id], 'last_update_time': time.time()}
+                self._dirty = True
 
     async def remove_channel(self, channel_id: int):
         """Thread-safe removal of channel from tracking."""
         async with self.config_lock:
             self._last_updates.pop(channel_id, None)
+            self._interval_cache.pop(channel_id, None)
+            self._next_due.pop(channel_id, None)
             # No need to update config as the channel will be removed from it
 
     async def get_channel_interval(self, channel_id: int) -> int:
-        """Thread-safe access to channel's refresh interval."""
-        async with self.config_lock:
-            channel_config = self._config['channels'].get(channel_id, {})
-            return channel_config.get('refresh_interval_minutes', 
-                                    self._config['default_refresh_interval_minutes'])
+        """Lock-free access to channel's refresh interval."""
+        return self._interval_cache.get(channel_id, self._config['default_refresh_interval_minutes'])
 
     async def set_channel_interval(self, channel_id: int, minutes: int):
         """Thread-safe update of channel's refresh interval."""
         async with self.config_lock:
-            if channel_id not in self._config['channels']:
+            channels = self._config['channels']
+            if channel_id not in channels:
                 raise ValueError(f"Channel {channel_id} not found in config")
             
-            self._config['channels'][channel_id]['refresh_interval_minutes'] = minutes
-            # Preserve last update time when saving
-            if channel_id in self._last_updates:
-                self._config['channels'][channel_id]['last_update_time'] = self._last_updates[channel_id]
-            save_config(self._config)
+            # Copying the entry preserves its last update time when saving
+            channels[channel_id] = {**channels[channel_id], 'refresh_interval_minutes': minutes}
+            self._dirty = True
+            self._interval_cache[channel_id] = minutes
             # Force an update on next check
-            self._last_updates[channel_id] = 0
+            self._last_updates.pop(channel_id, None)
+            self._next_due[channel_id] = 0.0
+
+    async def flush(self):
+        """Write the configuration to disk if it has unsaved changes."""
+        async with self.config_lock:
+            if not self._dirty:
+                return
+            payload = serialize_config(self._config)
+            channel_count = len(self._config['channels'])
+            self._dirty = False
+        await self._write_config(payload, channel_count)
+
+    async def _write_config(self, payload: bytes, channel_count: int):
+        """Write a serialized config to disk in a worker thread.
+
+        The config is serialized on the loop thread under config_lock, since
+        callers may keep mutating it, but the lock is released before the
+        write so tracker updates never wait on the disk.
+        """
+        async with self._write_lock:
+            try:
+                await asyncio.to_thread(write_config_file, payload)
+                logging.info(f"Saved config with {channel_count} channels")
+            except Exception as e:
+                logging.error(f"Error saving config: {e}")
+                self._dirty = True  # Retry on the next flush
 
     @property
     def config(self):
-        """Read-only access to config for non-critical operations."""
-        return self._config.copy()
+        """Read-only view of the live config, for callers that don't modify it.
+
+        Avoids copying the config; use get_config() for a copy to modify.
+        """
+        return MappingProxyType(self._config)
 
     async def should_update_bot_status(self, openai_status: str, anthropic_status: str) -> bool:
         """Check if bot status should be updated based on service status changes."""
@@ -208,11 +354,67 @@ if not DISCORD_TOKEN:
 intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix='/', intents=intents, application_id=CLIENT_ID)
-bot.launch_time = time.time()  # Track when the bot started
+bot.launch_time = time.monotonic()  # Track when the bot started (monotonic, for uptime)
 
 # Track the last status message
 last_status_message = None
 
+# Status messages fetched or sent this session, keyed by channel ID, so
+# routine updates can edit them without fetching them again first
+status_messages: Dict[int, discord.Message] = {}
+
+# What each channel's status message last showed and when it was written, so
+# unchanged messages are only re-edited once STATUS_EDIT_MAX_AGE has passed
+STATUS_EDIT_MAX_AGE = 3600  # seconds
+last_sent_status: Dict[int, tuple[tuple[str, str, int], float]] = {}
+
+# Shared HTTP session for status checks (created lazily, closed on shutdown)
+http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps connections to the status hosts alive between
+    polls instead of paying a fresh TCP+TLS handshake on every check.
+    """
+    global http_session
+    if http_session is None or http_session.closed:
+        # Resolve DNS with aiodns when available instead of bouncing through a thread pool
+        resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+        http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                resolver=resolver,
+                limit=10,
+                limit_per_host=4,  # Only a handful of fixed status hosts are ever contacted
+                keepalive_timeout=75,
+                ttl_dns_cache=600,
+                use_dns_cache=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=10),  # 10 second timeout
+            cookie_jar=aiohttp.DummyCookieJar()  # Status checks don't need cookies
+        )
+    return http_session
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session if it was opened."""
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Return an exponential backoff delay with full jitter.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        base: Delay ceiling for the first retry in seconds
+        cap: Upper bound for the delay ceiling in seconds
+    
+    Randomizing over the whole window keeps retries from many clients (or
+    both status checks) from hitting an endpoint in lockstep.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
 async def retry_connect(max_retries: int = 5, initial_delay: float = 1.0) -> None:
     """Attempt to connect to Discord with exponential backoff retry logic.
     
@@ -244,7 +446,7 @@ async def retry_connect(max_retries: int = 5, initial_delay: float = 1.0) -> Non
                 logging.error(f"Failed to connect after {max_retries} attempts: {type(e).__name__}: {str(e)}")
                 raise  # Re-raise the last exception
             
-            delay = initial_delay * (2 ** attempt)  # Exponential backoff
+            delay = backoff_delay(attempt, base=initial_delay)
             logging.warning(
                 f"Connection attempt {attempt + 1} failed with {type(e).__name__}: {str(e)}. "
                 f"Retrying in {delay:.1f}s..."
@@ -261,46 +463,101 @@ async def retry_connect(max_retries: int = 5, initial_delay: float = 1.0) -> Non
             logging.error(f"Unexpected error during connection: {type(e).__name__}: {str(e)}")
             raise
 
-async def check_status() -> tuple[str, str]:
+async def main() -> None:
+    """Run the bot and release shared resources once it stops."""
+    # Open the status session up front so it lives as long as the bot does
+    get_http_session()
+    try:
+        await retry_connect()
+    finally:
+        if config_flush.is_running():
+            config_flush.cancel()
+        await tracker.flush()  # Persist anything the flush loop hasn't written yet
+        await close_http_session()
+
+# Status endpoints, tried in order until one responds
+OPENAI_URLS = (
+    'https://status.openai.com/api/v2/status.json',
+    'https://status.openai.com/api/v2/components.json'  # Fallback endpoint
+)
+
+ANTHROPIC_URLS = (
+    'https://status.anthropic.com/api/v2/status.json',
+    'https://status.anthropic.com/api/v2/summary.json',  # Primary fallback
+    'https://status.anthropic.com/api/v2/components.json',  # Secondary fallback
+    'https://status.anthropic.com/api/v2/incidents.json'  # Tertiary fallback
+)
+
+# Lowercased status page descriptions that map to Operational / Limited
+OPERATIONAL_DESCRIPTION = 'all systems operational'
+LIMITED_KEYWORD = 'limited'
+
+# Pinged when every OpenAI status endpoint fails
+OPENAI_FALLBACK_URL = 'https://api.openai.com/v1/models'
+OPENAI_FALLBACK_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Conditional request headers and the status parsed from the last full response, per URL
+status_validators: Dict[str, tuple[Dict[str, str], str]] = {}
+
+async def check_status(session: aiohttp.ClientSession) -> tuple[str, str]:
     """Check the operational status of OpenAI and Anthropic services.
 
+    Args:
+        session: HTTP session to issue the status requests with
+
     Returns:
         A tuple containing the status strings for OpenAI and Anthropic
     """
-    timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout
     retry_attempts = 2
     
     async def check_service_status(session: aiohttp.ClientSession, url: str, service_name: str) -> str:
         """Check status for a single service with retries."""
         for attempt in range(retry_attempts + 1):
             try:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
+                # Revalidate against the last response so an unchanged page comes back as an empty 304
+                cached = status_validators.get(url)
+                async with session.get(url, headers=cached[0] if cached else None) as resp:
+                    if resp.status == 304 and cached:
+                        return cached[1]
+                    elif resp.status == 200:
                         data = await resp.json()
-                        status = data.get('status', {}).get('description', '').lower()
+                        try:
+                            description = data['status']['description'].lower()
+                        except (KeyError, TypeError, AttributeError):
+                            description = ''  # Payload without a status description
                         
-                        if status == 'all systems operational':
-                            return 'Operational'
-                        elif 'limited' in status:
-                            return 'Limited'
+                        if description == OPERATIONAL_DESCRIPTION:
+                            status = 'Operational'
+                        elif LIMITED_KEYWORD in description:
+                            status = 'Limited'
                         else:
-                            return 'Issues Detected'
+                            status = 'Issues Detected'
+                        
+                        # Remember the validators to send with the next request
+                        validators = {}
+                        if 'ETag' in resp.headers:
+                            validators['If-None-Match'] = resp.headers['ETag']
+                        if 'Last-Modified' in resp.headers:
+                            validators['If-Modified-Since'] = resp.headers['Last-Modified']
+                        if validators:
+                            status_validators[url] = (validators, status)
+                        return status
                     elif resp.status == 429:  # Rate limit
                         logging.warning(f"{service_name} status endpoint rate limited")
                         return 'Limited'
                     elif resp.status >= 500:  # Server error
                         logging.warning(f"{service_name} status endpoint server error: {resp.status}")
                         if attempt < retry_attempts:
-                            delay = 1 * (2 ** attempt)  # Exponential backoff
-                            logging.warning(f"Retrying in {delay}s...")
+                            delay = backoff_delay(attempt)
+                            logging.warning(f"Retrying in {delay:.1f}s...")
                             await asyncio.sleep(delay)
                             continue
                         return 'Issues Detected'
                     else:
                         logging.warning(f"{service_name} status endpoint returned {resp.status}")
                         if attempt < retry_attempts:
-                            delay = 1 * (2 ** attempt)  # Exponential backoff
-                            logging.warning(f"Retrying in {delay}s...")
+                            delay = backoff_delay(attempt)
+                            logging.warning(f"Retrying in {delay:.1f}s...")
                             await asyncio.sleep(delay)
                             continue
                         return 'Issues Detected'
@@ -308,8 +565,8 @@ async def check_status() -> tuple[str, str]:
             except asyncio.TimeoutError:
                 logging.warning(f"{service_name} status check timed out")
                 if attempt < retry_attempts:
-                    delay = 1 * (2 ** attempt)  # Exponential backoff
-                    logging.warning(f"Retrying in {delay}s...")
+                    delay = backoff_delay(attempt)
+                    logging.warning(f"Retrying in {delay:.1f}s...")
                     await asyncio.sleep(delay)
                     continue
                 return 'Issues Detected'
@@ -317,86 +574,178 @@ async def check_status() -> tuple[str, str]:
             except aiohttp.ClientError as e:
                 logging.error(f"{service_name} status check failed: {str(e)}")
                 if attempt < retry_attempts:
-                    delay = 1 * (2 ** attempt)
-                    logging.warning(f"Retrying in {delay}s...")
+                    delay = backoff_delay(attempt)
+                    logging.warning(f"Retrying in {delay:.1f}s...")
                     await asyncio.sleep(delay)
                     continue
                 return 'Issues Detected'
                 
-            except Exception as e:
-                logging.error(f"Unexpected error checking {service_name} status: {str(e)}")
+            except (ValueError, AttributeError) as e:
+                # Malformed or unexpected JSON payload
+                logging.error(f"Unexpected response checking {service_name} status: {str(e)}")
                 return 'Issues Detected'
         
         # If we've exhausted all retries without success, assume there are issues
         logging.error(f"{service_name} status check failed after all retry attempts")
         return 'Issues Detected'
     
-    # Fallback URLs in case the primary endpoints fail
-    OPENAI_URLS = [
-        'https://status.openai.com/api/v2/status.json',
-        'https://status.openai.com/api/v2/components.json'  # Fallback endpoint
-    ]
-    
-    ANTHROPIC_URLS = [
-        'https://status.anthropic.com/api/v2/status.json',
-        'https://status.anthropic.com/api/v2/summary.json',  # Primary fallback
-        'https://status.anthropic.com/api/v2/components.json',  # Secondary fallback
-        'https://status.anthropic.com/api/v2/incidents.json'  # Tertiary fallback
-    ]
-    
-    # Create a single session for all requests
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        # Try OpenAI status endpoints
-        openai_status = None
-        for url in OPENAI_URLS:
-            openai_status = await check_service_status(session, url, "OpenAI")
-            if openai_status != 'Issues Detected':
-                break
-        
-        # Try Anthropic status endpoints
-        anthropic_status = None
-        for url in ANTHROPIC_URLS:
-            anthropic_status = await check_service_status(session, url, "Anthropic")
-            if anthropic_status != 'Issues Detected':
+    async def check_service_urls(urls: tuple[str, ...], service_name: str) -> str:
+        """Try each status endpoint in order until one reports a usable status."""
+        status = None
+        for url in urls:
+            status = await check_service_status(session, url, service_name)
+            if status != 'Issues Detected':
                 break
+        return status
+    
+    async def check_openai() -> str:
+        """Check OpenAI status, pinging the API directly if every status endpoint fails."""
+        openai_status = await check_service_urls(OPENAI_URLS, "OpenAI")
         
         # Use fallback ping check if all status endpoints fail for OpenAI
+        # (only the response code matters here, so skip downloading a body)
         if openai_status == 'Issues Detected':
             try:
-                async with session.get('https://api.openai.com/v1/models', timeout=5) as resp:
+                async with session.head(OPENAI_FALLBACK_URL, timeout=OPENAI_FALLBACK_TIMEOUT) as resp:
                     if resp.status == 429:  # Rate limit
                         openai_status = 'Limited'
                     elif resp.status < 500:  # Any successful response or client error
                         openai_status = 'Operational'
                     else:  # Server error
                         openai_status = 'Issues Detected'
-            except Exception as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logging.error(f"OpenAI fallback check failed: {str(e)}")
                 # Keep as 'Issues Detected'
         
-        # For Anthropic, we'll keep the status as is since we don't have a reliable fallback endpoint
-        
-        return openai_status or 'Issues Detected', anthropic_status or 'Issues Detected'
+        return openai_status
+    
+    # Query both providers concurrently; they hit different hosts, and the
+    # OpenAI fallback ping overlaps with the Anthropic endpoint chain.
+    # For Anthropic, we'll keep the status as is since we don't have a reliable fallback endpoint
+    openai_status, anthropic_status = await asyncio.gather(
+        check_openai(),
+        check_service_urls(ANTHROPIC_URLS, "Anthropic")
+    )
+    
+    return openai_status or 'Issues Detected', anthropic_status or 'Issues Detected'
+
+
+# Cache of the last status check so callers in quick succession share one result
+STATUS_CACHE_TTL = 30  # Seconds a cached result is served as fresh
+STATUS_CACHE_SWR = 15  # Extra seconds a stale result is served while refreshing in the background
+_status_cache = {'ts': 0.0, 'value': None}
+_status_refresh_task: Optional[asyncio.Task] = None
+
+async def refresh_status_cache() -> tuple[str, str]:
+    """Run a status check and store the result in the cache.
+
+    Falls back to the last cached result if the check itself blows up.
+    """
+    try:
+        # Reuse the shared session so keep-alive connections survive between polls
+        value = await check_status(get_http_session())
+    except Exception as e:
+        if _status_cache['value'] is None:
+            raise
+        logging.error(f"Status check failed, serving last cached result: {e}")
+        return _status_cache['value']
+    
+    _status_cache['ts'] = time.monotonic()
+    _status_cache['value'] = value
+    return value
 
+def start_status_refresh() -> asyncio.Task:
+    """Start a status refresh unless one is already in flight, and return its task."""
+    global _status_refresh_task
+    if _status_refresh_task is None or _status_refresh_task.done():
+        _status_refresh_task = asyncio.create_task(refresh_status_cache())
+    return _status_refresh_task
 
-def create_status_embed(openai_status: str, anthropic_status: str, refresh_interval: int) -> discord.Embed:
+async def get_cached_status(force: bool = False) -> tuple[str, str]:
+    """Return the service statuses, reusing a recent result when possible.
+
+    Fresh results are returned as-is, slightly stale ones are returned while a
+    background refresh runs, and anything older waits for a new check. Callers
+    arriving while a check is in flight share it instead of starting another.
+
+    Args:
+        force: Ignore any cached result and wait for a new check
+    """
+    value = _status_cache['value']
+    if value is not None and not force:
+        age = time.monotonic() - _status_cache['ts']
+        if age < STATUS_CACHE_TTL:
+            return value
+        if age < STATUS_CACHE_TTL + STATUS_CACHE_SWR:
+            start_status_refresh()
+            return value
+    
+    # Shield the shared check so one cancelled caller doesn't cancel it for everyone
+    return await asyncio.shield(start_status_refresh())
+
+# Invariant parts of the status embed
+STATUS_EMBED_TITLE = "📡 AI Services Status Monitor"
+STATUS_EMBED_FOOTER = "Last updated"
+
+# Every status a service can be reported with
+KNOWN_STATUSES = ('Operational', 'Limited', 'Issues Detected', 'Status Check Failed')
+
+# Indicator emojis; anything not listed is shown as a problem
+STATUS_EMOJIS = {'Operational': "✅", 'Limited': "🔸"}
+
+def get_status_emoji(status: str) -> str:
+    """Return the indicator emoji for a service status."""
+    return STATUS_EMOJIS.get(status, "❌")
+
+def compute_status_color(openai_status: str, anthropic_status: str) -> discord.Color:
+    """Work out the embed color for a pair of service statuses."""
+    statuses = (openai_status, anthropic_status)
+    if all(status == 'Operational' for status in statuses):
+        return discord.Color.green()
+    elif any(status == 'Limited' for status in statuses):
+        return discord.Color.yellow()
+    else:
+        return discord.Color.red()
+
+# Embed colors for every pair of known statuses
+STATUS_COLORS = {
+    (openai_status, anthropic_status): compute_status_color(openai_status, anthropic_status)
+    for openai_status in KNOWN_STATUSES
+    for anthropic_status in KNOWN_STATUSES
+}
+
+# Pre-rendered embed field values for every known status
+STATUS_FIELD_VALUES = {
+    status: f"```{get_status_emoji(status)} {status}```"
+    for status in KNOWN_STATUSES
+}
+
+def format_status_field(status: str) -> str:
+    """Return the embed field value for a service status."""
+    value = STATUS_FIELD_VALUES.get(status)
+    if value is None:
+        value = f"```{get_status_emoji(status)} {status}```"
+    return value
+
+
+def create_status_embed(
+    openai_status: str,
+    anthropic_status: str,
+    refresh_interval: int,
+    timestamp: Optional[datetime] = None
+) -> discord.Embed:
     """Create an embedded message with current service status.
     
     Args:
         openai_status: Current status of OpenAI services
         anthropic_status: Current status of Anthropic services
         refresh_interval: Refresh interval in minutes for this channel
+        timestamp: Time shown as last updated; defaults to now
     """
-    # Use local time instead of UTC
-    local_time = datetime.fromtimestamp(time.time())
-    
     # Determine embed color based on status
-    if all(status == 'Operational' for status in [openai_status, anthropic_status]):
-        color = discord.Color.green()
-    elif any(status == 'Limited' for status in [openai_status, anthropic_status]):
-        color = discord.Color.yellow()
-    else:
-        color = discord.Color.red()
+    color = STATUS_COLORS.get((openai_status, anthropic_status))
+    if color is None:
+        color = compute_status_color(openai_status, anthropic_status)
     
     # Format refresh interval text
     if refresh_interval == 1:
@@ -405,33 +754,25 @@ def create_status_embed(openai_status: str, anthropic_status: str, refresh_inter
         refresh_text = f"Refreshes every {refresh_interval} minutes"
     
     embed = discord.Embed(
-        title="📡 AI Services Status Monitor",
+        title=STATUS_EMBED_TITLE,
         description=refresh_text,
         color=color,
-        timestamp=local_time
+        timestamp=timestamp or datetime.now(_UTC)
     )
     
     # Add status fields with emojis
-    def get_status_emoji(status: str) -> str:
-        if status == "Operational":
-            return "✅"
-        elif status == "Limited":
-            return "🔸"
-        else:
-            return "❌"
-    
     embed.add_field(
         name="OpenAI Status", 
-        value=f"```{get_status_emoji(openai_status)} {openai_status}```", 
+        value=format_status_field(openai_status), 
         inline=False  # Set to False for vertical layout
     )
     embed.add_field(
         name="Anthropic Status", 
-        value=f"```{get_status_emoji(anthropic_status)} {anthropic_status}```", 
+        value=format_status_field(anthropic_status), 
         inline=False  # Set to False for vertical layout
     )
     
-    embed.set_footer(text="Last updated")
+    embed.set_footer(text=STATUS_EMBED_FOOTER)
     return embed
 
 
@@ -494,6 +835,21 @@ class StatusButtons(discord.ui.View):
         await interaction.response.send_message(embed=help_embed, ephemeral=True)
 
 
+# Shared status view; its buttons are static so one instance serves every message
+_status_view: Optional[StatusButtons] = None
+
+def get_status_view() -> StatusButtons:
+    """Return the shared StatusButtons view, creating it on first use.
+
+    discord.py views need a running event loop to be constructed, so the
+    instance is built lazily instead of at import time.
+    """
+    global _status_view
+    if _status_view is None:
+        _status_view = StatusButtons()
+    return _status_view
+
+
 @bot.tree.command(name="refresh", description="Manually refresh the AI services status (Admin only)")
 @discord.app_commands.default_permissions(administrator=True)
 async def refresh(interaction: discord.Interaction):
@@ -501,7 +857,7 @@ async def refresh(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
     
     try:
-        await update_all_channels()
+        await update_all_channels(force=True)
         await interaction.followup.send("✅ Status has been manually refreshed!", ephemeral=True)
     except Exception as e:
         logging.error(f"Error during manual refresh: {e}")
@@ -518,6 +874,10 @@ async def on_ready() -> None:
         status=discord.Status.online
     )
     
+    # Register the shared view as persistent so the guide button on messages
+    # sent before a restart keeps responding (timeout=None alone isn't enough)
+    bot.add_view(get_status_view())
+    
     # Sync commands with Discord
     try:
         synced = await bot.tree.sync()
@@ -532,6 +892,36 @@ async def on_ready() -> None:
         status_update.change_interval(minutes=1)  # Always check every minute
         status_update.start()
         logging.info(f"Started status updates with {config['default_refresh_interval_minutes']} minute refresh interval")
+    
+    # Start periodic persistence of tracker state
+    if not config_flush.is_running():
+        config_flush.start()
+
+def forget_deleted_status_message(channel_id: Optional[int], message_id: int) -> None:
+    """Drop cached state for a status message deleted outside the bot.
+    
+    Args:
+        channel_id: Channel the message was deleted from
+        message_id: ID of the deleted message
+    """
+    channel_config = tracker.config['channels'].get(channel_id)
+    if channel_config is not None and channel_config['message_id'] == message_id:
+        # Without the cached state the next due update edits the message, gets
+        # NotFound and recreates it instead of skipping it as unchanged
+        status_messages.pop(channel_id, None)
+        last_sent_status.pop(channel_id, None)
+        logging.info(f"Status message {message_id} was deleted in channel {channel_id}, recreating on next update")
+
+@bot.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent) -> None:
+    """Handle deletion of a tracked status message."""
+    forget_deleted_status_message(payload.channel_id, payload.message_id)
+
+@bot.event
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent) -> None:
+    """Handle bulk deletions that include a tracked status message."""
+    for message_id in payload.message_ids:
+        forget_deleted_status_message(payload.channel_id, message_id)
 
 
 @bot.tree.command(name="create", description="Create a status tracker in this channel (Admin only)")
@@ -557,14 +947,15 @@ async def create(interaction: discord.Interaction, interval: int = 5):
             return
         
         # Create initial status message
-        openai_status, anthropic_status = await check_status()
+        openai_status, anthropic_status = await get_cached_status()
         
         # Create embed and view
         embed = create_status_embed(openai_status, anthropic_status, interval)
-        view = StatusButtons()
+        view = get_status_view()
         
         # Send message and store its ID
         message = await interaction.channel.send(embed=embed, view=view)
+        status_messages[channel_id] = message
         
         # Update config with new channel
         config['channels'][channel_id] = {
@@ -625,152 +1016,285 @@ async def status_update() -> None:
     """Update status message based on refresh interval from config."""
     await update_all_channels()
 
-async def update_all_channels() -> None:
-    """Update all channels that need refreshing. Can be called manually or by the task loop."""
-    config = await tracker.get_config()
+@tasks.loop(seconds=30)
+async def config_flush() -> None:
+    """Persist tracker changes accumulated since the last flush."""
+    await tracker.flush()
+
+# Maximum number of status messages edited concurrently
+UPDATE_CONCURRENCY = 10
+
+def can_post_status(channel: Optional[discord.abc.Messageable]) -> bool:
+    """Check whether the bot can post and edit status embeds in a guild channel.
     
-    # Check services status
-    openai_status, anthropic_status = await check_status()
+    Args:
+        channel: Channel to check, or None if it couldn't be resolved
+    """
+    if channel is None or getattr(channel, 'guild', None) is None:
+        return False
+    permissions = channel.permissions_for(channel.guild.me)
+    return permissions.view_channel and permissions.send_messages and permissions.embed_links
+
+def status_is_current(channel_id: int, content_key: tuple[str, str, int]) -> bool:
+    """Check whether a channel's status message already shows this content.
     
-    # Track channels per server
-    servers_with_trackers = {}
-    for channel_id_str in config['channels'].keys():
-        try:
-            # Validate channel ID format
-            try:
-                channel_id = int(channel_id_str)
-            except ValueError:
-                logging.error(f"Invalid channel ID format in config: {channel_id_str}")
-                continue
+    Args:
+        channel_id: Channel whose status message is checked
+        content_key: OpenAI status, Anthropic status and refresh interval to show
+    
+    Returns:
+        True if the last edit sent this content and is recent enough not to be refreshed
+    """
+    last_sent = last_sent_status.get(channel_id)
+    return (
+        last_sent is not None
+        and last_sent[0] == content_key
+        and time.monotonic() - last_sent[1] < STATUS_EDIT_MAX_AGE
+    )
 
-            # First try to get the channel from cache
-            channel = bot.get_channel(channel_id)
-            
-            # If not in cache, try to fetch it with proper error handling
-            if not channel:
-                try:
-                    channel = await bot.fetch_channel(channel_id)
-                except discord.Forbidden:
-                    logging.warning(f"Bot lacks permission to access channel {channel_id}")
-                    continue
-                except discord.NotFound:
-                    logging.warning(f"Channel {channel_id} not found")
-                    continue
-                except discord.HTTPException as e:
-                    logging.error(f"HTTP error fetching channel {channel_id}: {e}")
-                    continue
-            
-            # Verify bot has required permissions in the channel
-            if channel and channel.guild:
-                permissions = channel.permissions_for(channel.guild.me)
-                if not (permissions.view_channel and permissions.send_messages and permissions.embed_links):
-                    logging.warning(f"Bot lacks required permissions in channel {channel_id}")
-                    continue
-                    
-                # Add to server tracking if all checks pass
-                if channel.guild.id not in servers_with_trackers:
-                    servers_with_trackers[channel.guild.id] = set()
-                servers_with_trackers[channel.guild.id].add(channel_id)
-                
-        except Exception as e:
-            logging.error(f"Error processing channel {channel_id_str}: {e}")
-            continue
+async def get_status_message(channel: discord.abc.Messageable, message_id: int) -> discord.Message:
+    """Return a status message, preferring discord.py's message cache over a REST fetch.
     
-    # Only update bot status if service status has changed AND we have servers with single channels
-    if await tracker.should_update_bot_status(openai_status, anthropic_status):
-        # Only change presence if we have any tracked channels
-        should_change_presence = bool(servers_with_trackers)
-        
-        if should_change_presence:
-            # Determine status based on service health
-            if all(status == 'Operational' for status in [openai_status, anthropic_status]):
-                new_status = discord.Status.online
-            elif any(status == 'Limited' for status in [openai_status, anthropic_status]):
-                new_status = discord.Status.idle
-            else:  # Issues Detected or Status Check Failed
-                new_status = discord.Status.dnd
-            
-            # Update presence with appropriate status while maintaining activity
-            await bot.change_presence(
-                activity=discord.Activity(type=discord.ActivityType.watching, name="AI Status"),
-                status=new_status
-            )
+    Args:
+        channel: Channel the message was posted in
+        message_id: ID of the status message
+    """
+    message = discord.utils.get(bot.cached_messages, id=message_id)
+    if message is None:
+        message = await channel.fetch_message(message_id)
+    return message
+
+class AsyncTokenBucket:
+    """Token bucket that paces a burst of requests without blocking the event loop."""
+
+    def __init__(self, capacity: int, rate: float):
+        """Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum number of requests allowed in a burst
+            rate: Number of tokens added back per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+            self._tokens -= 1
+
+# Paces status message edits and sends so large batches don't run into Discord's rate limits
+message_bucket = AsyncTokenBucket(capacity=5, rate=5)
+
+async def update_channel_status(
+    channel_id: int,
+    channel_config: dict,
+    openai_status: str,
+    anthropic_status: str,
+    embed: discord.Embed,
+    force: bool,
+    semaphore: asyncio.Semaphore
+) -> tuple[Optional[discord.abc.Messageable], bool, Optional[int]]:
+    """Refresh the status message in a single channel.
     
-    # First pass: identify invalid channels
-    channels_to_remove = set()
-    for channel_id in list(config['channels'].keys()):
+    Args:
+        channel_id: Channel whose status message should be updated
+        channel_config: The channel's tracker configuration
+        openai_status: Current status of OpenAI services
+        anthropic_status: Current status of Anthropic services
+        embed: Status embed to show, shared by channels with the same interval
+        force: Edit the message even if its content hasn't changed
+        semaphore: Limits how many channels are updated at once
+    
+    Returns:
+        The resolved channel (None if it couldn't be resolved), whether the channel
+        is gone and should be removed, and the ID of a newly sent status message
+        if the old one was missing
+    """
+    channel = None
+    async with semaphore:
         try:
+            # Use the cached channel if we have it; a channel we can't fetch is gone
             channel = bot.get_channel(channel_id)
-            if not channel:
+            if channel is None:
                 try:
                     channel = await bot.fetch_channel(channel_id)
                 except (discord.NotFound, discord.Forbidden):
                     logging.warning(f"Channel {channel_id} is no longer accessible, removing from config")
-                    channels_to_remove.add(channel_id)
-                except Exception as e:
-                    logging.error(f"Unexpected error fetching channel {channel_id}: {e}")
-                    # Don't remove channel for temporary errors
-                    continue
-        except Exception as e:
-            logging.error(f"Error checking channel {channel_id}: {e}")
-            if isinstance(e, (discord.Forbidden, discord.NotFound)):
-                channels_to_remove.add(channel_id)
-    
-    # Remove invalid channels all at once
-    if channels_to_remove:
-        new_config = await tracker.get_config()  # Get fresh config
-        for channel_id in channels_to_remove:
-            if channel_id in new_config['channels']:  # Add safety check
-                new_config['channels'].pop(channel_id)
-                await tracker.remove_channel(channel_id)
-        await tracker.update_config(new_config)
-        logging.info(f"Removed {len(channels_to_remove)} invalid channels from config: {channels_to_remove}")
-        config = await tracker.get_config()  # Get updated config for channel processing
-    
-    # Second pass: update remaining valid channels
-    for channel_id, channel_config in list(config['channels'].items()):
-        try:
-            channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
-            if not channel:
-                continue  # Skip if channel is not accessible (will be removed in next iteration)
+                    return None, True, None
+            
+            # Skip the edit if the message already shows this exact status
+            content_key = (openai_status, anthropic_status, channel_config['refresh_interval_minutes'])
+            if not force and status_is_current(channel_id, content_key):
+                await tracker.mark_channel_updated(channel_id)
+                return channel, False, None
             
             try:
-                message = await channel.fetch_message(channel_config['message_id'])
-                embed = create_status_embed(openai_status, anthropic_status, channel_config['refresh_interval_minutes'])
-                view = StatusButtons()
-                await message.edit(embed=embed, view=view)
+                # Reuse the message from a previous update if we still hold it
+                message = status_messages.get(channel_id)
+                if message is None or message.id != channel_config['message_id']:
+                    message = await get_status_message(channel, channel_config['message_id'])
+                # The buttons never change and stay wired up through the persistent view,
+                # so only the embed is sent
+                await message_bucket.acquire()
+                status_messages[channel_id] = await message.edit(embed=embed)
+                last_sent_status[channel_id] = (content_key, time.monotonic())
                 await tracker.mark_channel_updated(channel_id)
             except discord.NotFound:
                 # Message not found, create new one
+                status_messages.pop(channel_id, None)
                 logging.warning(f"Message {channel_config['message_id']} not found in channel {channel_id}, creating new message")
-                embed = create_status_embed(openai_status, anthropic_status, channel_config['refresh_interval_minutes'])
-                view = StatusButtons()
+                view = get_status_view()
+                await message_bucket.acquire()
                 new_message = await channel.send(embed=embed, view=view)
-                
-                # Update message ID in config
-                new_config = await tracker.get_config()  # Get fresh config
-                if channel_id in new_config['channels']:  # Check if channel still exists
-                    new_config['channels'][channel_id]['message_id'] = new_message.id
-                    await tracker.update_config(new_config)
-                    await tracker.mark_channel_updated(channel_id)
+                status_messages[channel_id] = new_message
+                last_sent_status[channel_id] = (content_key, time.monotonic())
+                await tracker.mark_channel_updated(channel_id)
+                return channel, False, new_message.id
             except discord.Forbidden:
                 logging.warning(f"Bot no longer has permission to access messages in channel {channel_id}")
                 # Will be removed in next iteration
-                continue
             except discord.HTTPException as e:
                 logging.error(f"HTTP error updating message in channel {channel_id}: {e}")
                 # Don't remove channel for temporary HTTP errors
-                continue
             except Exception as e:
                 logging.error(f"Error updating message in channel {channel_id}: {e}")
-                # Only remove channel if it's a permissions or not found error
-                if isinstance(e, (discord.Forbidden, discord.NotFound)):
-                    # Will be removed in next iteration
-                    continue
                 
         except Exception as e:
             logging.error(f"Error processing channel {channel_id}: {e}")
             # Channel errors will be handled in next iteration
+    
+    return channel, False, None
+
+async def apply_channel_changes(channels_to_remove: set[int], recreated: Dict[int, int]) -> None:
+    """Remove dead channels and record recreated status messages in one config update.
+    
+    Args:
+        channels_to_remove: Channels that are gone and should stop being tracked
+        recreated: New status message IDs for channels whose message was recreated
+    
+    The changes are applied to a fresh config copy, so anything changed by other
+    commands or the update loop while the caller was working is kept.
+    """
+    if not channels_to_remove and not recreated:
+        return
+    
+    new_config = await tracker.get_config()
+    for channel_id in channels_to_remove:
+        new_config['channels'].pop(channel_id, None)  # May already be gone via /delete
+        status_messages.pop(channel_id, None)
+        last_sent_status.pop(channel_id, None)
+    await asyncio.gather(*(tracker.remove_channel(channel_id) for channel_id in channels_to_remove))
+    for channel_id, message_id in recreated.items():
+        if channel_id in new_config['channels']:  # Check if channel still exists
+            new_config['channels'][channel_id]['message_id'] = message_id
+    await tracker.update_config(new_config)
+    if channels_to_remove:
+        logging.info(f"Removed {len(channels_to_remove)} invalid channels from config: {channels_to_remove}")
+
+async def update_all_channels(force: bool = False) -> None:
+    """Update all channels that need refreshing. Can be called manually or by the task loop.
+    
+    Args:
+        force: Edit every status message even if its content hasn't changed
+    """
+    # Snapshot the channels once so every pass below sees the same set
+    channels_snapshot = tuple(tracker.config['channels'].items())
+    
+    # Only channels whose refresh interval has elapsed are updated (all of them when forced)
+    due_channels = {
+        channel_id for channel_id, _ in channels_snapshot
+        if force or await tracker.should_update_channel(channel_id)
+    }
+    if not due_channels:
+        logging.debug("No channels due for an update")
+        return
+    
+    # Check services status (served from cache if checked moments ago, unless forced)
+    openai_status, anthropic_status = await get_cached_status(force=force)
+    
+    due_configs = [
+        (channel_id, channel_config)
+        for channel_id, channel_config in channels_snapshot
+        if channel_id in due_channels
+    ]
+    
+    # If every due channel already shows this status, the workers would only mark them
+    # updated, so do that here and skip the Discord round trips. Channels whose last
+    # edit failed or has gone stale still need sending, which runs the full pass.
+    if not force and all(
+        status_is_current(channel_id, (openai_status, anthropic_status, channel_config['refresh_interval_minutes']))
+        for channel_id, channel_config in due_configs
+    ):
+        await asyncio.gather(*(tracker.mark_channel_updated(channel_id) for channel_id in due_channels))
+        logging.debug("Due channels already show the current status, skipping update pass")
+        return
+    
+    # Update the channels that are due, several at a time
+    semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
+    
+    # Channels with the same refresh interval show identical embeds, so build one per interval
+    now = datetime.now(_UTC)
+    embeds = {
+        interval: create_status_embed(openai_status, anthropic_status, interval, now)
+        for interval in {channel_config['refresh_interval_minutes'] for _, channel_config in due_configs}
+    }
+    
+    results = await asyncio.gather(*(
+        update_channel_status(
+            channel_id,
+            channel_config,
+            openai_status,
+            anthropic_status,
+            embeds[channel_config['refresh_interval_minutes']],
+            force,
+            semaphore
+        )
+        for channel_id, channel_config in due_configs
+    ))
+    
+    # Only update bot status if service status has changed AND the bot has a usable tracker:
+    # one of the channels just resolved, or any other tracked channel already in the cache
+    if await tracker.should_update_bot_status(openai_status, anthropic_status):
+        usable_channels = [channel for channel, _, _ in results]
+        usable_channels.extend(
+            bot.get_channel(channel_id) for channel_id, _ in channels_snapshot
+            if channel_id not in due_channels
+        )
+        if any(can_post_status(channel) for channel in usable_channels):
+            # Determine status based on service health
+            if all(status == 'Operational' for status in [openai_status, anthropic_status]):
+                new_status = discord.Status.online
+            elif any(status == 'Limited' for status in [openai_status, anthropic_status]):
+                new_status = discord.Status.idle
+            else:  # Issues Detected or Status Check Failed
+                new_status = discord.Status.dnd
+            
+            # Update presence with appropriate status while maintaining activity
+            await bot.change_presence(
+                activity=discord.Activity(type=discord.ActivityType.watching, name="AI Status"),
+                status=new_status
+            )
+    
+    # Apply removals and replacement messages in a single config update
+    channels_to_remove = set()
+    recreated = {}
+    for (channel_id, _), (_, remove, message_id) in zip(due_configs, results):
+        if remove:
+            channels_to_remove.add(channel_id)
+        elif message_id is not None:
+            recreated[channel_id] = message_id
+    await apply_channel_changes(channels_to_remove, recreated)
 
 @bot.tree.command(name="delete", description="Delete the status tracker from this channel (Admin only)")
 @discord.app_commands.default_permissions(administrator=True)
@@ -808,11 +1332,13 @@ async def delete(interaction: discord.Interaction):
             logging.error(f"Error deleting message {message_id} in channel {channel_id}: {e}")
         
         # Remove from config regardless of message deletion status
-        config['channels'].pop(channel_id)
+        config['channels'].pop(channel_id, None)
         await tracker.update_config(config)
         
         # Remove channel from tracking
         await tracker.remove_channel(channel_id)
+        status_messages.pop(channel_id, None)
+        last_sent_status.pop(channel_id, None)
         
         # Prepare status message
         status = "✅ Status tracker configuration removed"
@@ -839,7 +1365,7 @@ async def list_trackers(interaction: discord.Interaction):
     
     try:
         # Get current config
-        config = await tracker.get_config()
+        config = tracker.config
         
         if not config['channels']:
             await interaction.followup.send("ℹ️ No status trackers are currently deployed.", ephemeral=True)
@@ -852,9 +1378,16 @@ async def list_trackers(interaction: discord.Interaction):
             color=discord.Color.blue()
         )
         
+        # Index the cached channels and threads once; bot.get_channel searches guild by guild on every call
+        channel_index = {
+            channel.id: channel
+            for guild in bot.guilds
+            for channel in (*guild.channels, *guild.threads)
+        }
+        
         # Add field for each tracker
         for channel_id, channel_config in config['channels'].items():
-            channel = bot.get_channel(channel_id)
+            channel = channel_index.get(channel_id)
             channel_name = f"#{channel.name}" if channel else "Unknown Channel"
             guild_name = channel.guild.name if channel else "Unknown Server"
             
@@ -880,6 +1413,58 @@ async def list_trackers(interaction: discord.Interaction):
         logging.error(f"Error listing status trackers: {e}")
         await interaction.followup.send("❌ Failed to list status trackers. Check logs for details.", ephemeral=True)
 
+def join_in_chunks(lines, size: int) -> list[str]:
+    """Join lines into newline-separated blocks for embed fields.
+    
+    Args:
+        lines: Lines to group, in order
+        size: Maximum number of lines per block
+    
+    Returns:
+        One joined string per block of up to size lines
+    """
+    it = iter(lines)
+    return ['\n'.join(chunk) for chunk in iter(lambda: list(islice(it, size)), [])]
+
+# Maximum number of trackers /debug checks concurrently
+DEBUG_FETCH_CONCURRENCY = 8
+
+async def describe_tracker(channel_id: int, channel_config: dict, semaphore: asyncio.Semaphore) -> str:
+    """Check a tracker's channel and message and describe them for /debug.
+    
+    Args:
+        channel_id: Channel the tracker lives in
+        channel_config: The channel's tracker configuration
+        semaphore: Limits how many trackers are checked at once
+    """
+    async with semaphore:
+        # Use the cached channel if we have it, otherwise fetch it
+        channel = bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await bot.fetch_channel(channel_id)
+            except (discord.NotFound, discord.Forbidden):
+                return f"Channel {channel_id}: Not Found"
+            except Exception as e:
+                return f"Channel {channel_id}: ✗ Error: {str(e)}"
+        
+        try:
+            await channel.fetch_message(channel_config['message_id'])
+            message_status = "✓ Message Found"
+        except discord.NotFound:
+            message_status = "✗ Message Missing"
+        except discord.Forbidden:
+            message_status = "✗ No Access"
+        except Exception as e:
+            message_status = f"✗ Error: {str(e)}"
+    
+    return (
+        f"Channel: #{channel.name} ({channel_id})\n"
+        f"Server: {channel.guild.name}\n"
+        f"Refresh: {channel_config['refresh_interval_minutes']}m\n"
+        f"Message: {message_status}"
+    )
+
 @bot.tree.command(name="debug", description="Get comprehensive debug information (Admin only)")
 @discord.app_commands.default_permissions(administrator=True)
 async def debug(interaction: discord.Interaction):
@@ -888,22 +1473,23 @@ async def debug(interaction: discord.Interaction):
     
     try:
         # Get current config and bot info
-        config = await tracker.get_config()
+        config = tracker.config
         bot_latency = round(bot.latency * 1000)  # Convert to milliseconds
+        now = datetime.now(_UTC)
         
         # Create debug embed
         embed = discord.Embed(
             title="🔧 Debug Information",
             description="Comprehensive status and configuration information",
             color=discord.Color.blue(),
-            timestamp=datetime.now()
+            timestamp=now
         )
         
         # Bot Status
         bot_status = (
             f"• Status: {str(bot.status).title()}\n"
             f"• Latency: {bot_latency}ms\n"
-            f"• Uptime: {time.time() - bot.launch_time:.2f}s"
+            f"• Uptime: {time.monotonic() - bot.launch_time:.2f}s"
         )
         embed.add_field(name="Bot Status", value=f"```{bot_status}```", inline=False)
         
@@ -916,7 +1502,7 @@ async def debug(interaction: discord.Interaction):
         
         # Service Status
         try:
-            openai_status, anthropic_status = await check_status()
+            openai_status, anthropic_status = await get_cached_status()
             service_status = (
                 f"• OpenAI: {openai_status}\n"
                 f"• Anthropic: {anthropic_status}"
@@ -927,36 +1513,19 @@ async def debug(interaction: discord.Interaction):
         
         # Channel Details
         if config['channels']:
-            channels_status = []
-            for channel_id, channel_config in config['channels'].items():
-                channel = bot.get_channel(channel_id)
-                if channel:
-                    try:
-                        message = await channel.fetch_message(channel_config['message_id'])
-                        message_status = "✓ Message Found"
-                    except discord.NotFound:
-                        message_status = "✗ Message Missing"
-                    except discord.Forbidden:
-                        message_status = "✗ No Access"
-                    except Exception as e:
-                        message_status = f"✗ Error: {str(e)}"
-                    
-                    channel_status = (
-                        f"Channel: #{channel.name} ({channel_id})\n"
-                        f"Server: {channel.guild.name}\n"
-                        f"Refresh: {channel_config['refresh_interval_minutes']}m\n"
-                        f"Message: {message_status}"
-                    )
-                else:
-                    channel_status = f"Channel {channel_id}: Not Found"
-                channels_status.append(channel_status)
+            # Check every tracker concurrently, a few at a time
+            semaphore = asyncio.Semaphore(DEBUG_FETCH_CONCURRENCY)
+            channels_status = await asyncio.gather(*(
+                describe_tracker(channel_id, channel_config, semaphore)
+                for channel_id, channel_config in config['channels'].items()
+            ))
             
             # Split channel status into chunks if too long
-            status_chunks = [channels_status[i:i+5] for i in range(0, len(channels_status), 5)]
+            status_chunks = join_in_chunks(channels_status, 5)
             for i, chunk in enumerate(status_chunks, 1):
                 embed.add_field(
                     name=f"Channel Details ({i}/{len(status_chunks)})", 
-                    value=f"```{chr(10).join(chunk)}```",
+                    value=f"```{chunk}```",
                     inline=False
                 )
         
@@ -965,16 +1534,16 @@ async def debug(interaction: discord.Interaction):
             f"• Python: {sys.version.split()[0]}\n"
             f"• discord.py: {discord.__version__}\n"
             f"• OS: {sys.platform}\n"
-            f"• Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            f"• Time: {now.astimezone().strftime('%Y-%m-%d %H:%M:%S')}"
         )
         embed.add_field(name="System Information", value=f"```{system_info}```", inline=False)
         
         # Add last update times
         last_updates = []
         for channel_id in config['channels']:
-            last_update = tracker._last_updates.get(channel_id, 0)
-            if last_update > 0:
-                time_diff = time.time() - last_update
+            last_update = tracker._last_updates.get(channel_id)
+            if last_update is not None:
+                time_diff = time.monotonic() - last_update
                 last_updates.append(f"<#{channel_id}>: {time_diff:.1f}s ago")
         
         if last_updates:
@@ -1024,7 +1593,7 @@ async def set_default_interval(
         
         # Update default refresh interval
         config['default_refresh_interval_minutes'] = minutes
-        await tracker.update_config(config)
+        config = await tracker.update_config(config)
         
         # Create response embed
         embed = discord.Embed(
@@ -1064,6 +1633,81 @@ async def set_default_interval(
             ephemeral=True
         )
 
+async def sync_channel(
+    channel_id: int,
+    channel_config: dict,
+    embed: discord.Embed,
+    semaphore: asyncio.Semaphore
+) -> tuple[str, Optional[str], Optional[int]]:
+    """Verify and refresh the status tracker in a single channel for /sync.
+    
+    Args:
+        channel_id: Channel whose tracker should be synced
+        channel_config: The channel's tracker configuration
+        embed: Status embed to show, shared by channels with the same interval
+        semaphore: Limits how many channels are synced at once
+    
+    Returns:
+        A tuple of the outcome ('success', 'recreated', 'failed' or 'removed'),
+        an issue line for the sync report or None, and the ID of a newly sent
+        status message or None
+    """
+    async with semaphore:
+        try:
+            # Use the cached channel if we have it, otherwise fetch it (e.g. on another shard)
+            channel = bot.get_channel(channel_id)
+            if channel is None:
+                try:
+                    channel = await bot.fetch_channel(channel_id)
+                except discord.NotFound:
+                    return 'removed', f"❌ Channel {channel_id} not found", None
+                except discord.Forbidden:
+                    return 'removed', f"❌ No access to channel {channel_id}", None
+                except discord.HTTPException as e:
+                    if e.code == 50001:  # Missing Access
+                        return 'removed', f"❌ Missing access to channel {channel_id}", None
+                    elif e.code == 50004:  # Not in Guild
+                        return 'removed', f"❌ Bot not in guild for channel {channel_id}", None
+                    else:
+                        return 'failed', f"❌ HTTP error for channel {channel_id}: {e.text}", None
+                except Exception as e:
+                    return 'failed', f"❌ Unexpected error fetching channel {channel_id}: {str(e)}", None
+            
+            try:
+                # Try to get existing message
+                message = await get_status_message(channel, channel_config['message_id'])
+                
+                # Update existing message
+                view = get_status_view()
+                await message_bucket.acquire()
+                await message.edit(embed=embed, view=view)
+                outcome, issue, new_message_id = 'success', None, None
+                
+            except discord.NotFound:
+                # Message not found, create new one
+                view = get_status_view()
+                await message_bucket.acquire()
+                new_message = await channel.send(embed=embed, view=view)
+                outcome, issue, new_message_id = 'recreated', f"🔄 Recreated tracker in #{channel.name}", new_message.id
+                
+            except discord.Forbidden:
+                return 'removed', f"❌ No message permissions in #{channel.name}", None
+                
+            except discord.HTTPException as e:
+                if e.code == 50001:  # Missing Access
+                    return 'removed', f"❌ Missing message access in #{channel.name}", None
+                return 'failed', f"❌ HTTP error in #{channel.name}: {e.text}", None
+                
+            except Exception as e:
+                return 'failed', f"❌ Error in #{channel.name}: {str(e)}", None
+            
+            # Mark channel as just updated if we got this far
+            await tracker.mark_channel_updated(channel_id)
+            return outcome, issue, new_message_id
+            
+        except Exception as e:
+            return 'failed', f"❌ Unexpected error with {channel_id}: {str(e)}", None
+
 @bot.tree.command(
     name="sync",
     description="Force sync all trackers and verify their status (Admin only)"
@@ -1074,19 +1718,20 @@ async def sync_trackers(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
     
     try:
-        # Get current config
-        config = await tracker.get_config()
+        # Get current config (read-only; changes are applied to a fresh copy afterwards)
+        config = tracker.config
         
         if not config['channels']:
             await interaction.followup.send("ℹ️ No status trackers to sync.", ephemeral=True)
             return
         
         # Create progress embed
+        start_now = datetime.now(_UTC)
         embed = discord.Embed(
             title="🔄 Syncing Status Trackers",
             description=f"Syncing {len(config['channels'])} tracker(s)...",
             color=discord.Color.blue(),
-            timestamp=datetime.now()
+            timestamp=start_now
         )
         progress_message = await interaction.followup.send(embed=embed, ephemeral=True)
         
@@ -1099,123 +1744,54 @@ async def sync_trackers(interaction: discord.Interaction):
             'issues': []
         }
         
-        # Get current service status once for all updates
+        # Get current service status once for all updates, bypassing the cache
         try:
-            openai_status, anthropic_status = await check_status()
+            openai_status, anthropic_status = await get_cached_status(force=True)
         except Exception as e:
             logging.error(f"Error checking service status during sync: {e}")
             results['issues'].append("⚠️ Failed to check service status")
             openai_status = anthropic_status = "Status Check Failed"
         
-        # Process each channel
+        # Process all channels concurrently, a few at a time
+        semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
+        channel_items = tuple(config['channels'].items())
+        
+        # Build each distinct embed once; only the refresh interval varies between channels
+        embeds = {}
+        for _, channel_config in channel_items:
+            interval = channel_config['refresh_interval_minutes']
+            if interval not in embeds:
+                embeds[interval] = create_status_embed(openai_status, anthropic_status, interval, start_now)
+        
+        outcomes = await asyncio.gather(*(
+            sync_channel(channel_id, channel_config, embeds[channel_config['refresh_interval_minutes']], semaphore)
+            for channel_id, channel_config in channel_items
+        ))
+        
         channels_to_remove = set()
-        for channel_id, channel_config in list(config['channels'].items()):
-            try:
-                # Always try to fetch the channel first, regardless of shard
-                try:
-                    channel = await bot.fetch_channel(channel_id)
-                except discord.NotFound:
-                    results['issues'].append(f"❌ Channel {channel_id} not found")
-                    channels_to_remove.add(channel_id)
-                    results['removed'] += 1
-                    continue
-                except discord.Forbidden:
-                    results['issues'].append(f"❌ No access to channel {channel_id}")
-                    channels_to_remove.add(channel_id)
-                    results['removed'] += 1
-                    continue
-                except discord.HTTPException as e:
-                    if e.code == 50001:  # Missing Access
-                        results['issues'].append(f"❌ Missing access to channel {channel_id}")
-                        channels_to_remove.add(channel_id)
-                        results['removed'] += 1
-                        continue
-                    elif e.code == 50004:  # Not in Guild
-                        results['issues'].append(f"❌ Bot not in guild for channel {channel_id}")
-                        channels_to_remove.add(channel_id)
-                        results['removed'] += 1
-                        continue
-                    else:
-                        results['issues'].append(f"❌ HTTP error for channel {channel_id}: {e.text}")
-                        results['failed'] += 1
-                        continue
-                except Exception as e:
-                    results['issues'].append(f"❌ Unexpected error fetching channel {channel_id}: {str(e)}")
-                    results['failed'] += 1
-                    continue
-                
-                try:
-                    # Try to get existing message
-                    message = await channel.fetch_message(channel_config['message_id'])
-                    
-                    # Update existing message
-                    embed = create_status_embed(
-                        openai_status,
-                        anthropic_status,
-                        channel_config['refresh_interval_minutes']
-                    )
-                    view = StatusButtons()
-                    await message.edit(embed=embed, view=view)
-                    results['success'] += 1
-                    
-                except discord.NotFound:
-                    # Message not found, create new one
-                    embed = create_status_embed(
-                        openai_status,
-                        anthropic_status,
-                        channel_config['refresh_interval_minutes']
-                    )
-                    view = StatusButtons()
-                    new_message = await channel.send(embed=embed, view=view)
-                    
-                    # Update config with new message ID
-                    config['channels'][channel_id]['message_id'] = new_message.id
-                    results['recreated'] += 1
-                    results['issues'].append(f"🔄 Recreated tracker in #{channel.name}")
-                    
-                except discord.Forbidden:
-                    results['issues'].append(f"❌ No message permissions in #{channel.name}")
-                    channels_to_remove.add(channel_id)
-                    results['removed'] += 1
-                    
-                except discord.HTTPException as e:
-                    if e.code == 50001:  # Missing Access
-                        results['issues'].append(f"❌ Missing message access in #{channel.name}")
-                        channels_to_remove.add(channel_id)
-                        results['removed'] += 1
-                    else:
-                        results['failed'] += 1
-                        results['issues'].append(f"❌ HTTP error in #{channel.name}: {e.text}")
-                    continue
-                    
-                except Exception as e:
-                    results['failed'] += 1
-                    results['issues'].append(f"❌ Error in #{channel.name}: {str(e)}")
-                    continue
-                
-                # Mark channel as just updated if we got this far
-                await tracker.mark_channel_updated(channel_id)
-                
-            except Exception as e:
-                results['failed'] += 1
-                results['issues'].append(f"❌ Unexpected error with {channel_id}: {str(e)}")
+        recreated = {}
+        for (channel_id, _), (outcome, issue, new_message_id) in zip(channel_items, outcomes):
+            results[outcome] += 1
+            if issue:
+                results['issues'].append(issue)
+            if outcome == 'removed':
+                channels_to_remove.add(channel_id)
+            elif new_message_id is not None:
+                recreated[channel_id] = new_message_id
         
-        # Remove invalid channels
-        if channels_to_remove:
-            for channel_id in channels_to_remove:
-                config['channels'].pop(channel_id, None)
-                await tracker.remove_channel(channel_id)
-            await tracker.update_config(config)
+        # Remove invalid channels and record recreated messages
+        await apply_channel_changes(channels_to_remove, recreated)
         
         # Create final status embed
+        completed_at = datetime.now(_UTC)
         status_embed = discord.Embed(
             title="🔄 Sync Complete",
             description=(
-                f"Processed {len(config['channels']) + len(channels_to_remove)} tracker(s)\n"
-                f"Completed at {datetime.now().strftime('%H:%M:%S')}"
+                f"Processed {len(channel_items)} tracker(s)\n"
+                f"Completed at {completed_at.astimezone().strftime('%H:%M:%S')}"
             ),
             color=discord.Color.green() if results['failed'] == 0 else discord.Color.orange(),
-            timestamp=datetime.now()
+            timestamp=completed_at
         )
         
         # Add results field
@@ -1233,11 +1809,11 @@ async def sync_trackers(interaction: discord.Interaction):
         # Add issues if any
         if results['issues']:
             # Split issues into chunks if too many
-            issue_chunks = [results['issues'][i:i+10] for i in range(0, len(results['issues']), 10)]
+            issue_chunks = join_in_chunks(results['issues'], 10)
             for i, chunk in enumerate(issue_chunks, 1):
                 status_embed.add_field(
                     name=f"Issues ({i}/{len(issue_chunks)})",
-                    value="\n".join(chunk),
+                    value=chunk,
                     inline=False
                 )
         
@@ -1268,9 +1844,14 @@ if __name__ == "__main__":
     if not CLIENT_ID:
         raise ValueError("No Client ID found. Make sure CLIENT_ID is set in your .env file")
     
+    # Use the faster libuv-based event loop when it's installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logging.info("Using uvloop event loop")
+    
     try:
         logging.info("Starting bot...")
-        asyncio.run(retry_connect())
+        asyncio.run(main())
     except KeyboardInterrupt:
         logging.info("Received keyboard interrupt. Shutting down gracefully...")
     except discord.LoginFailure as e: